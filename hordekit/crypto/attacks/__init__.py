@@ -1,3 +1,4 @@
+from hordekit.crypto.attacks.affine.known_plaintext import affine_known_plaintext
 from hordekit.crypto.attacks.generic.brute_force import brute_force
 from hordekit.crypto.attacks.generic.dictionary import dictionary_attack
 from hordekit.crypto.attacks.hill.known_plaintext import hill_known_plaintext
@@ -12,4 +13,5 @@ __all__ = [
     "index_of_coincidence",
     "kasiski",
     "hill_known_plaintext",
+    "affine_known_plaintext",
 ]
@@ -0,0 +1,3 @@
+from hordekit.crypto.attacks.affine.known_plaintext import affine_known_plaintext
+
+__all__ = ["affine_known_plaintext"]
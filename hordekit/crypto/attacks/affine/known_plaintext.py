@@ -0,0 +1,48 @@
+import math
+from itertools import combinations
+
+from hordekit.core.result import HordeResult
+
+
+def affine_known_plaintext(plaintext: bytes, ciphertext: bytes) -> HordeResult:
+    """Recover an Affine cipher key (a, b) from known plaintext/ciphertext letter pairs.
+
+    Two letter pairs give the linear system c ≡ a·p + b (mod 26), solved directly:
+    a ≡ (c₁ − c₂)·(p₁ − p₂)⁻¹ and b ≡ c₁ − a·p₁ (mod 26). No key enumeration is needed.
+
+    Args:
+        plaintext:  Known plaintext — at least 2 alphabetic characters (non-alpha ignored).
+        ciphertext: Corresponding ciphertext, aligned letter for letter.
+
+    Returns:
+        HordeResult whose bytes are ``bytes([a, b])``.
+        metadata["a"] and metadata["b"] are the recovered key, ready for ``Affine(a=..., b=...)``.
+
+    Raises:
+        ValueError: If no letter pair has a plaintext difference invertible mod 26,
+                    or the pairs are not consistent with a single Affine key.
+    """
+
+    def _letters(data: bytes) -> list[int]:
+        return [b - 65 if 65 <= b <= 90 else b - 97 for b in data if 65 <= b <= 90 or 97 <= b <= 122]
+
+    pairs = list(zip(_letters(plaintext), _letters(ciphertext), strict=False))
+    if len(pairs) < 2:
+        raise ValueError(f"Need ≥ 2 aligned plaintext/ciphertext letters, got {len(pairs)}")
+
+    for (p1, c1), (p2, c2) in combinations(pairs, 2):
+        try:
+            inv = pow((p1 - p2) % 26, -1, 26)
+        except ValueError:
+            continue  # difference shares a factor with 26 — try the next pair
+        a = (c1 - c2) * inv % 26
+        b = (c1 - a * p1) % 26
+        break
+    else:
+        raise ValueError("No plaintext letter pair has a difference invertible mod 26; provide more known plaintext")
+
+    # An 'a' sharing a factor with 26 fits the letters but is not a valid Affine key.
+    if math.gcd(a, 26) != 1 or any((a * p + b) % 26 != c for p, c in pairs):
+        raise ValueError(f"Letter pairs are not consistent with a single Affine key (tried a={a}, b={b})")
+
+    return HordeResult(bytes([a, b]), metadata={"a": a, "b": b})
@@ -1,4 +1,7 @@
+import re
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from typing import Any
 
 from hordekit.core.base import BaseCipher
@@ -6,20 +9,87 @@ from hordekit.core.result import HordeResult
 from hordekit.crypto.attacks.scoring import quadgram_score
 
 
+def _compile_mask(mask: str | bytes | re.Pattern[str] | re.Pattern[bytes]) -> re.Pattern[bytes]:
+    # Candidates are bytes, so str masks (plain or compiled) are re-encoded as bytes patterns.
+    if isinstance(mask, str):
+        return re.compile(mask.encode("utf-8"))
+    if isinstance(mask, bytes):
+        return re.compile(mask)
+    if isinstance(mask.pattern, str):
+        return re.compile(mask.pattern.encode("utf-8"), mask.flags & ~re.UNICODE)
+    return mask
+
+
+def _score_keys(
+    cipher_cls: type[BaseCipher],
+    keys: list[dict[str, Any]],
+    ciphertext: bytes,
+    score_fn: Callable[[bytes], float],
+    pattern: re.Pattern[bytes] | None,
+) -> list[dict[str, Any]]:
+    # Materialize every candidate plaintext first, then filter and score them.
+    pairs = [(key, cipher_cls(**key).decrypt(ciphertext)) for key in keys]
+    if pattern is not None:
+        pairs = [(key, result) for key, result in pairs if pattern.search(result.as_bytes())]
+    return [{"key": key, "result": result, "score": score_fn(result.as_bytes())} for key, result in pairs]
+
+
 def brute_force(
     cipher_cls: type[BaseCipher],
     ciphertext: bytes,
     scorer: Callable[[bytes], float] | None = None,
+    mask: str | bytes | re.Pattern[str] | re.Pattern[bytes] | None = None,
+    workers: int = 1,
 ) -> HordeResult:
+    """Try every key from ``cipher_cls.possible_keys()`` and return the best-scoring decryption.
+
+    Args:
+        cipher_cls: Cipher class that implements ``possible_keys()``.
+        ciphertext: Bytes to decrypt.
+        scorer: Scoring function bytes -> float (higher = more likely English).
+                Defaults to quadgram scoring.
+        mask: Optional regular expression a decryption must contain, e.g. ``r"FLAG\\{.*\\}"``.
+              Compiled once (a pre-compiled pattern keeps its flags); non-matching
+              candidates are dropped before scoring.
+        workers: Number of processes to split the key space across. The default of 1
+                 runs in-process; larger values only pay off for big key spaces or long
+                 ciphertexts. ``cipher_cls`` and ``scorer`` must be picklable.
+
+    Raises:
+        ValueError: If ``mask`` is given and no decryption matches it.
+
+    Example::
+
+        from hordekit.crypto.attacks.generic import brute_force
+        from hordekit.crypto.classical.substitution import Caesar
+
+        result = brute_force(Caesar, ciphertext, mask=r"^[A-Z ]+$")
+        print(result.as_str())
+        print(result.metadata["candidates"][0]["key"])
+    """
     score_fn = scorer if scorer is not None else quadgram_score
     keys = cipher_cls.possible_keys()
 
-    candidates: list[dict[str, Any]] = []
-    for key in keys:
-        instance = cipher_cls(**key)
-        result = instance.decrypt(ciphertext)
-        score = score_fn(result.as_bytes())
-        candidates.append({"key": key, "result": result, "score": score})
+    pattern = _compile_mask(mask) if mask is not None else None
+
+    if workers > 1 and len(keys) > 1:
+        size = -(-len(keys) // workers)
+        bounds = range(0, len(keys), size)
+        with ProcessPoolExecutor(max_workers=len(bounds)) as pool:
+            parts = pool.map(
+                _score_keys,
+                repeat(cipher_cls),
+                [keys[i : i + size] for i in bounds],
+                repeat(ciphertext),
+                repeat(score_fn),
+                repeat(pattern),
+            )
+            candidates = [candidate for part in parts for candidate in part]
+    else:
+        candidates = _score_keys(cipher_cls, keys, ciphertext, score_fn, pattern)
+
+    if mask is not None and not candidates:
+        raise ValueError(f"No candidates matched mask {mask!r}")
 
     candidates.sort(key=lambda x: x["score"], reverse=True)
     best = candidates[0]["result"]
@@ -0,0 +1,6 @@
+_NON_LETTERS = bytes(b for b in range(256) if not (65 <= b <= 90 or 97 <= b <= 122))
+
+
+def upper_letters(data: bytes) -> str:
+    """Return the ASCII letters of ``data`` uppercased, with every other byte dropped."""
+    return data.translate(None, _NON_LETTERS).upper().decode("ascii")
@@ -30,25 +30,27 @@ _EN_FREQ: dict[str, float] = {
 }
 
 
-def _letter_frequencies(text: str) -> dict[str, float]:
-    letters = [c for c in text.lower() if c.isalpha()]
-    total = len(letters)
+_LETTERS = b"abcdefghijklmnopqrstuvwxyz"
+
+
+def _letter_frequencies(data: bytes) -> dict[str, float]:
+    lowered = data.lower()
+    counts = {chr(b): n for b in _LETTERS if (n := lowered.count(b))}
+    total = sum(counts.values())
     if total == 0:
         return {}
-    counts: dict[str, int] = {}
-    for c in letters:
-        counts[c] = counts.get(c, 0) + 1
     return {c: count / total for c, count in counts.items()}
 
 
-def _rank_by_frequency(text: str) -> list[str]:
-    freq = _letter_frequencies(text)
-    return [c for c, _ in sorted(freq.items(), key=lambda x: x[1], reverse=True)]
+def _rank_by_frequency(data: bytes) -> list[str]:
+    freq = _letter_frequencies(data)
+    lowered = data.lower()
+    # Ties are broken by first appearance in the ciphertext.
+    return sorted(freq, key=lambda c: (-freq[c], lowered.find(ord(c))))
 
 
 def frequency_analysis(ciphertext: bytes) -> HordeResult:
-    text = ciphertext.decode("utf-8", errors="ignore")
-    cipher_ranked = _rank_by_frequency(text)
+    cipher_ranked = _rank_by_frequency(ciphertext)
     en_ranked = list(_EN_FREQ.keys())
 
     mapping: dict[str, str] = {}
@@ -56,12 +58,13 @@ def frequency_analysis(ciphertext: bytes) -> HordeResult:
         if i < len(en_ranked):
             mapping[cipher_char] = en_ranked[i]
 
-    translation: dict[int, int] = {}
-    for cipher_char, plain_char in mapping.items():
-        translation[ord(cipher_char)] = ord(plain_char)
-        translation[ord(cipher_char.upper())] = ord(plain_char.upper())
-
-    decrypted = bytes(translation.get(b, b) for b in ciphertext)
+    cipher_letters = "".join(mapping)
+    plain_letters = "".join(mapping.values())
+    table = bytes.maketrans(
+        (cipher_letters + cipher_letters.upper()).encode("ascii"),
+        (plain_letters + plain_letters.upper()).encode("ascii"),
+    )
+    decrypted = ciphertext.translate(table)
 
     candidates: list[tuple[str, str]] = [(k, v) for k, v in sorted(mapping.items())]
 
@@ -1,4 +1,5 @@
 from hordekit.core.result import HordeResult
+from hordekit.crypto.attacks.letters import upper_letters
 
 _EN_IOC = 0.065
 _RAND_IOC = 0.038
@@ -8,10 +9,7 @@ def _ioc(letters: str) -> float:
     n = len(letters)
     if n < 2:
         return 0.0
-    counts: dict[str, int] = {}
-    for c in letters:
-        counts[c] = counts.get(c, 0) + 1
-    return sum(v * (v - 1) for v in counts.values()) / (n * (n - 1))
+    return sum(v * (v - 1) for v in map(letters.count, set(letters))) / (n * (n - 1))
 
 
 def index_of_coincidence(ciphertext: bytes, max_key_length: int = 20) -> HordeResult:
@@ -42,8 +40,7 @@ def index_of_coincidence(ciphertext: bytes, max_key_length: int = 20) -> HordeRe
         print(result.metadata["overall_ioc"])
         print(result.metadata["likely_key_length"])
     """
-    text = ciphertext.decode("utf-8", errors="ignore").upper()
-    letters = "".join(c for c in text if c.isalpha())
+    letters = upper_letters(ciphertext)
 
     overall = _ioc(letters)
 
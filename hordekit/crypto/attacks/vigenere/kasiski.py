@@ -2,6 +2,7 @@ from functools import reduce
 from math import gcd
 
 from hordekit.core.result import HordeResult
+from hordekit.crypto.attacks.letters import upper_letters
 
 
 def _gcd_list(numbers: list[int]) -> int:
@@ -33,8 +34,7 @@ def kasiski(ciphertext: bytes, ngram_size: int = 3, max_key_length: int = 20) ->
         result = kasiski(ciphertext)
         print(result.metadata["likely_key_lengths"])  # e.g. [6, 3, 12, ...]
     """
-    text = ciphertext.decode("utf-8", errors="ignore").upper()
-    letters = "".join(c for c in text if c.isalpha())
+    letters = upper_letters(ciphertext)
 
     if len(letters) < ngram_size * 3:
         return HordeResult(
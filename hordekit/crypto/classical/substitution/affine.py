@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any
 
 from hordekit.core.base import BaseCipher
@@ -5,6 +6,19 @@ from hordekit.core.result import HordeResult
 
 _VALID_A = [1, 3, 5, 7, 9, 11, 15, 17, 19, 21, 23, 25]
 
+_UPPER = b"ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_LOWER = b"abcdefghijklmnopqrstuvwxyz"
+
+
+@lru_cache(maxsize=len(_VALID_A) * 26)
+def _tables(a: int, b: int) -> tuple[bytes, bytes]:
+    """Return the ``(encrypt, decrypt)`` translation tables for a valid key."""
+    # Letter i maps to (a*i + b) mod 26: rotate by b, then take every a-th letter of the repeated alphabet.
+    upper = ((_UPPER[b:] + _UPPER[:b]) * a)[::a]
+    plain = _UPPER + _LOWER
+    cipher = upper + upper.lower()
+    return bytes.maketrans(plain, cipher), bytes.maketrans(cipher, plain)
+
 
 class Affine(BaseCipher):
     def __init__(self, a: int, b: int) -> None:
@@ -12,27 +26,13 @@ class Affine(BaseCipher):
             raise ValueError(f"'a' must be coprime with 26, got {a}. Valid values: {_VALID_A}")
         self.a = a
         self.b = b % 26
-        self._a_inv = pow(a, -1, 26)
+        self._encrypt_table, self._decrypt_table = _tables(self.a, self.b)
 
     def encrypt(self, data: bytes) -> HordeResult:
-        def _enc(byte: int) -> int:
-            if 65 <= byte <= 90:
-                return (self.a * (byte - 65) + self.b) % 26 + 65
-            if 97 <= byte <= 122:
-                return (self.a * (byte - 97) + self.b) % 26 + 97
-            return byte
-
-        return HordeResult(bytes(_enc(b) for b in data))
+        return HordeResult(data.translate(self._encrypt_table))
 
     def decrypt(self, data: bytes) -> HordeResult:
-        def _dec(byte: int) -> int:
-            if 65 <= byte <= 90:
-                return (self._a_inv * ((byte - 65) - self.b)) % 26 + 65
-            if 97 <= byte <= 122:
-                return (self._a_inv * ((byte - 97) - self.b)) % 26 + 97
-            return byte
-
-        return HordeResult(bytes(_dec(b) for b in data))
+        return HordeResult(data.translate(self._decrypt_table))
 
     @classmethod
     def possible_keys(cls) -> list[dict[str, Any]]:
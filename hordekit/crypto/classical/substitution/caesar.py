@@ -1,26 +1,31 @@
+from functools import lru_cache
 from typing import Any
 
 from hordekit.core.base import BaseCipher
 from hordekit.core.result import HordeResult
 
+_UPPER = b"ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_LOWER = b"abcdefghijklmnopqrstuvwxyz"
 
-def _shift_byte(b: int, shift: int) -> int:
-    if 65 <= b <= 90:
-        return (b - 65 + shift) % 26 + 65
-    if 97 <= b <= 122:
-        return (b - 97 + shift) % 26 + 97
-    return b
+
+@lru_cache(maxsize=26)
+def _tables(shift: int) -> tuple[bytes, bytes]:
+    """Return the ``(encrypt, decrypt)`` translation tables for a shift in 0–25."""
+    shifted = _UPPER[shift:] + _UPPER[:shift] + _LOWER[shift:] + _LOWER[:shift]
+    plain = _UPPER + _LOWER
+    return bytes.maketrans(plain, shifted), bytes.maketrans(shifted, plain)
 
 
 class Caesar(BaseCipher):
     def __init__(self, shift: int) -> None:
         self.shift = shift % 26
+        self._encrypt_table, self._decrypt_table = _tables(self.shift)
 
     def encrypt(self, data: bytes) -> HordeResult:
-        return HordeResult(bytes(_shift_byte(b, self.shift) for b in data))
+        return HordeResult(data.translate(self._encrypt_table))
 
     def decrypt(self, data: bytes) -> HordeResult:
-        return HordeResult(bytes(_shift_byte(b, -self.shift) for b in data))
+        return HordeResult(data.translate(self._decrypt_table))
 
     @classmethod
     def possible_keys(cls) -> list[dict[str, Any]]:
@@ -1,3 +1,7 @@
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+
 from hordekit.core.base import BaseCipher
 from hordekit.core.result import HordeResult
 
@@ -21,10 +25,12 @@ class FourSquare(BaseCipher):
         if not any(65 <= b <= 90 or 97 <= b <= 122 for b in key2):
             raise ValueError("key2 must contain at least one ASCII letter")
         self._plain, self._plain_pos = self._build_square(b"")
-        self._cipher1, self._cipher1_pos = self._build_square(key1)
-        self._cipher2, self._cipher2_pos = self._build_square(key2)
+        self._cipher1, self._cipher1_pos = self._build_square(bytes(key1))
+        self._cipher2, self._cipher2_pos = self._build_square(bytes(key2))
 
-    def _build_square(self, key: bytes) -> tuple[list[list[int]], dict[int, tuple[int, int]]]:
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _build_square(key: bytes) -> tuple[tuple[tuple[int, ...], ...], Mapping[int, tuple[int, int]]]:
         seen: set[int] = set()
         order: list[int] = []
         for b in key:
@@ -45,12 +51,12 @@ class FourSquare(BaseCipher):
             if v not in seen:
                 seen.add(v)
                 order.append(v)
-        square = [order[r * 5 : r * 5 + 5] for r in range(5)]
+        square = tuple(tuple(order[r * 5 : r * 5 + 5]) for r in range(5))
         pos: dict[int, tuple[int, int]] = {}
         for r, row in enumerate(square):
             for c, val in enumerate(row):
                 pos[val] = (r, c)
-        return square, pos
+        return square, MappingProxyType(pos)
 
     def _encrypt_pair(self, a: int, b: int) -> tuple[int, int]:
         # a from top-left (plain), b from bottom-right (plain); read the
@@ -1,3 +1,7 @@
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+
 from hordekit.core.base import BaseCipher
 from hordekit.core.result import HordeResult
 
@@ -13,9 +17,11 @@ class Polybius(BaseCipher):
     def __init__(self, key: bytes = b"") -> None:
         if key and not any(65 <= b <= 90 or 97 <= b <= 122 for b in key):
             raise ValueError("Key must contain at least one ASCII letter")
-        self._square, self._pos = self._build_square(key)
+        self._square, self._pos = self._build_square(bytes(key))
 
-    def _build_square(self, key: bytes) -> tuple[list[list[int]], dict[int, tuple[int, int]]]:
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _build_square(key: bytes) -> tuple[tuple[tuple[int, ...], ...], Mapping[int, tuple[int, int]]]:
         seen: set[int] = set()
         order: list[int] = []
         for b in key:
@@ -36,12 +42,12 @@ class Polybius(BaseCipher):
             if v not in seen:
                 seen.add(v)
                 order.append(v)
-        square = [order[r * 5 : r * 5 + 5] for r in range(5)]
+        square = tuple(tuple(order[r * 5 : r * 5 + 5]) for r in range(5))
         pos: dict[int, tuple[int, int]] = {}
         for r, row in enumerate(square):
             for c, val in enumerate(row):
                 pos[val] = (r, c)
-        return square, pos
+        return square, MappingProxyType(pos)
 
     def encrypt(self, data: bytes) -> HordeResult:
         result: list[int] = []
@@ -3,16 +3,13 @@ from typing import Any
 from hordekit.core.base import BaseCipher
 from hordekit.core.result import HordeResult
 
-
-def _rot47_byte(b: int) -> int:
-    if 33 <= b <= 126:
-        return (b - 33 + 47) % 94 + 33
-    return b
+_PRINTABLE = bytes(range(33, 127))
+_TABLE = bytes.maketrans(_PRINTABLE, _PRINTABLE[47:] + _PRINTABLE[:47])
 
 
 class ROT47(BaseCipher):
     def encrypt(self, data: bytes) -> HordeResult:
-        return HordeResult(bytes(_rot47_byte(b) for b in data))
+        return HordeResult(data.translate(_TABLE))
 
     def decrypt(self, data: bytes) -> HordeResult:
         return self.encrypt(data)
@@ -11,35 +11,42 @@ class _NScoring:
     _floor: float = 0.01
 
     def __init__(self) -> None:
-        ngrams = str(ROOT_DIR.joinpath(self._filename).resolve())
-        self._ngrams = {}
-        for line in open(ngrams):
-            key, count = line.split(" ")
-            self._ngrams[key] = int(count)
+        with open(ROOT_DIR.joinpath(self._filename).resolve()) as f:
+            # One split over the whole file; the fields alternate key, count.
+            fields = iter(f.read().split())
+        counts = dict(zip(fields, map(int, fields), strict=True))
 
-        summary = sum(self._ngrams.values())
+        summary = sum(counts.values())
         # calculate log probabilities
-        for key in self._ngrams.keys():
-            self._ngrams[key] = log10(self._ngrams[key] / summary)
-
+        self._ngrams = {key: log10(count / summary) for key, count in counts.items()}
         self._floor = log10(0.01 / summary)
 
     def score(self, text: str) -> float:
-        score = 0.0
-        ngrams = self._ngrams.__getitem__
-        for i in range(len(text) - self._N + 1):
-            ngram = text[i : i + self._N].upper()
-            if ngram in self._ngrams:
-                score += ngrams(ngram)
-            else:
-                score += self._floor
-        return score
+        get, floor, n = self._ngrams.get, self._floor, self._N
+        if text.isascii():
+            # ASCII uppercasing preserves length, so uppercase once instead of once per window.
+            text = text.upper()
+            return sum((get(text[i : i + n], floor) for i in range(len(text) - n + 1)), 0.0)
+        return sum((get(text[i : i + n].upper(), floor) for i in range(len(text) - n + 1)), 0.0)
 
 
 class MonogramScore(_NScoring):
     _N = 1
     _filename = "monograms.txt"
 
+    def score(self, text: str) -> float:
+        if not text.isascii():
+            return super().score(text)
+        # Monograms only depend on the letter histogram: one count per letter, not one lookup per character.
+        upper = text.upper()
+        letters = 0
+        score = 0.0
+        for key, log_prob in self._ngrams.items():
+            count = upper.count(key)
+            letters += count
+            score += count * log_prob
+        return score + (len(text) - letters) * self._floor
+
 
 class BigramScore(_NScoring):
     _N = 2
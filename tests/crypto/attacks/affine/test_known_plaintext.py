@@ -0,0 +1,48 @@
+import pytest
+
+from hordekit.crypto.attacks.affine.known_plaintext import affine_known_plaintext
+from hordekit.crypto.classical.substitution.affine import Affine
+
+
+class TestAffineKnownPlaintext:
+    def test_recovers_key(self) -> None:
+        result = affine_known_plaintext(b"AFFINECIPHER", b"IHHWVCSWFRCP")
+        assert result.metadata["a"] == 5
+        assert result.metadata["b"] == 8
+
+    def test_result_bytes_are_key(self) -> None:
+        result = affine_known_plaintext(b"AFFINECIPHER", b"IHHWVCSWFRCP")
+        assert result.as_bytes() == bytes([5, 8])
+
+    @pytest.mark.parametrize(("a", "b"), [(1, 0), (3, 7), (9, 13), (25, 25)])
+    def test_recovers_every_kind_of_key(self, a: int, b: int) -> None:
+        pt = b"Hello, World"
+        ct = Affine(a=a, b=b).encrypt(pt).as_bytes()
+        result = affine_known_plaintext(pt, ct)
+        assert (result.metadata["a"], result.metadata["b"]) == (a, b)
+
+    def test_skips_non_invertible_difference(self) -> None:
+        # A→C differs by 2 (not invertible mod 26); A→B differs by 1 and is used instead
+        pt = b"ACB"
+        ct = Affine(a=7, b=3).encrypt(pt).as_bytes()
+        result = affine_known_plaintext(pt, ct)
+        assert (result.metadata["a"], result.metadata["b"]) == (7, 3)
+
+    def test_pair_without_first_letter(self) -> None:
+        # A−N = 13 and A−C = 2 are not invertible mod 26; only N−C = 11 is
+        result = affine_known_plaintext(b"ANC", b"IVS")
+        assert (result.metadata["a"], result.metadata["b"]) == (5, 8)
+
+    def test_too_few_letters_raises(self) -> None:
+        with pytest.raises(ValueError, match="Need ≥ 2"):
+            affine_known_plaintext(b"A", b"I")
+
+    def test_no_invertible_pair_raises(self) -> None:
+        with pytest.raises(ValueError, match="invertible"):
+            affine_known_plaintext(b"AAC", b"IIS")
+
+    # AB→AC and ABCD→ACEG solve to a=2, which is not coprime with 26
+    @pytest.mark.parametrize(("pt", "ct"), [(b"ABC", b"IHZ"), (b"AB", b"AC"), (b"ABCD", b"ACEG")])
+    def test_inconsistent_pairs_raise(self, pt: bytes, ct: bytes) -> None:
+        with pytest.raises(ValueError, match="not consistent"):
+            affine_known_plaintext(pt, ct)
@@ -1,4 +1,10 @@
+import re
+
+import pytest
+
 from hordekit.crypto.attacks.generic.brute_force import brute_force
+from hordekit.crypto.attacks.scoring import monogram_score
+from hordekit.crypto.classical.substitution.affine import Affine
 from hordekit.crypto.classical.substitution.caesar import Caesar
 
 
@@ -26,3 +32,36 @@ class TestBruteForce:
         ciphertext = Caesar(shift=1).encrypt(b"aaa").as_bytes()
         result = brute_force(Caesar, ciphertext, scorer=lambda data: -len(data))
         assert "candidates" in result.metadata
+
+    def test_mask_filters_candidates(self) -> None:
+        ciphertext = Caesar(shift=9).encrypt(b"FLAG{caesar} is here").as_bytes()
+        result = brute_force(Caesar, ciphertext, mask=r"FLAG\{.*\}")
+        assert result.as_str() == "FLAG{caesar} is here"
+        assert [c["key"] for c in result.metadata["candidates"]] == [{"shift": 9}]
+
+    def test_mask_accepts_bytes(self) -> None:
+        ciphertext = Caesar(shift=4).encrypt(b"HELLO").as_bytes()
+        result = brute_force(Caesar, ciphertext, mask=rb"^HELLO$")
+        assert result.as_str() == "HELLO"
+
+    def test_mask_accepts_compiled_pattern(self) -> None:
+        ciphertext = Caesar(shift=11).encrypt(b"the flag{rot} is here").as_bytes()
+        result = brute_force(Caesar, ciphertext, mask=re.compile(rb"FLAG\{\w+\}", re.IGNORECASE))
+        assert result.as_str() == "the flag{rot} is here"
+
+    def test_mask_accepts_compiled_str_pattern(self) -> None:
+        ciphertext = Caesar(shift=6).encrypt(b"FLAG{caesar} is here").as_bytes()
+        result = brute_force(Caesar, ciphertext, mask=re.compile(r"FLAG\{.*\}"))
+        assert result.as_str() == "FLAG{caesar} is here"
+
+    def test_mask_without_match_raises(self) -> None:
+        ciphertext = Caesar(shift=2).encrypt(b"hello").as_bytes()
+        with pytest.raises(ValueError, match="No candidates matched mask"):
+            brute_force(Caesar, ciphertext, mask=r"\d")
+
+    def test_workers_match_serial(self) -> None:
+        ciphertext = Affine(a=7, b=3).encrypt(b"attack at dawn and hold the bridge").as_bytes()
+        serial = brute_force(Affine, ciphertext, scorer=monogram_score)
+        parallel = brute_force(Affine, ciphertext, scorer=monogram_score, workers=2)
+        assert parallel == serial
+        assert [c["key"] for c in parallel.metadata["candidates"]] == [c["key"] for c in serial.metadata["candidates"]]
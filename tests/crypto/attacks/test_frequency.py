@@ -0,0 +1,24 @@
+from hordekit.crypto.attacks.substitution import frequency_analysis
+
+
+def test_mapping_preserves_case_and_non_alpha() -> None:
+    result = frequency_analysis(b"Xxx yy, Z!")
+    mapping = result.metadata["mapping"]
+    assert result.as_str() == f"{mapping['x'].upper()}{mapping['x'] * 2} {mapping['y'] * 2}, {mapping['z'].upper()}!"
+
+
+def test_most_frequent_letter_maps_to_e() -> None:
+    result = frequency_analysis(b"qqqq rr s")
+    assert result.metadata["mapping"]["q"] == "e"
+    assert result.as_str().startswith("eeee")
+
+
+def test_ties_ranked_by_first_appearance() -> None:
+    assert frequency_analysis(b"ba").as_str() == "et"
+    assert frequency_analysis(b"the quick brown fox jumps over the lazy dog").as_str().startswith("aot sirhd")
+
+
+def test_empty_ciphertext() -> None:
+    result = frequency_analysis(b"")
+    assert result.as_bytes() == b""
+    assert result.metadata["mapping"] == {}
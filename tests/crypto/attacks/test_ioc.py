@@ -51,3 +51,9 @@ def test_returns_original_ciphertext() -> None:
     ct = b"KHOOR ZRUOG" * 5
     result = index_of_coincidence(ct)
     assert result.as_bytes() == ct
+
+
+def test_non_letters_ignored() -> None:
+    ct = Caesar(shift=5).encrypt(_EN_TEXT).as_bytes()
+    noisy = ct.replace(b" ", b" 7\xc3\xa9, ")
+    assert index_of_coincidence(noisy).metadata["overall_ioc"] == index_of_coincidence(ct).metadata["overall_ioc"]
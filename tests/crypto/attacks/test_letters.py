@@ -0,0 +1,9 @@
+from hordekit.crypto.attacks.letters import upper_letters
+
+
+def test_keeps_only_uppercased_ascii_letters() -> None:
+    assert upper_letters(b"Hello, World! 123 \xe9\x00z") == "HELLOWORLDZ"
+
+
+def test_empty() -> None:
+    assert upper_letters(b"") == ""
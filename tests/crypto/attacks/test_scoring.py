@@ -0,0 +1,49 @@
+import pytest
+
+from hordekit.legacy.ngram_score import BigramScore, MonogramScore, QuadgramScore
+
+
+@pytest.fixture(scope="module")
+def mono() -> MonogramScore:
+    return MonogramScore()
+
+
+@pytest.fixture(scope="module")
+def bi() -> BigramScore:
+    return BigramScore()
+
+
+@pytest.fixture(scope="module")
+def quad() -> QuadgramScore:
+    return QuadgramScore()
+
+
+class TestMonogramScore:
+    def test_matches_per_character_scoring(self, mono: MonogramScore) -> None:
+        text = "Hello, World! The quick brown fox."
+        expected = sum(mono._ngrams.get(c.upper(), mono._floor) for c in text)
+        assert mono.score(text) == pytest.approx(expected)
+
+    def test_non_ascii_falls_back(self, mono: MonogramScore) -> None:
+        text = "naïve café"
+        expected = sum(mono._ngrams.get(c.upper(), mono._floor) for c in text)
+        assert mono.score(text) == pytest.approx(expected)
+
+    def test_common_letter_scores_higher(self, mono: MonogramScore) -> None:
+        assert mono.score("E") > mono.score("Z")
+
+
+def test_quadgram_prefers_english(quad: QuadgramScore) -> None:
+    assert quad.score("THEQUICKBROWNFOX") > quad.score("XQZJVKWPXQZJVKWP")
+
+
+@pytest.mark.parametrize("text", ["", "ab", "Hello, World!", "THE QUICK BROWN FOX"])
+def test_bigram_matches_per_window_lookup(bi: BigramScore, text: str) -> None:
+    expected = sum(bi._ngrams.get(text[i : i + 2].upper(), bi._floor) for i in range(len(text) - 1))
+    assert bi.score(text) == pytest.approx(expected)
+
+
+def test_quadgram_non_ascii_matches_per_window_lookup(quad: QuadgramScore) -> None:
+    text = "straße thé"
+    expected = sum(quad._ngrams.get(text[i : i + 4].upper(), quad._floor) for i in range(len(text) - 3))
+    assert quad.score(text) == pytest.approx(expected)
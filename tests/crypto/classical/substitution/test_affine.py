@@ -15,9 +15,10 @@ class TestAffine:
         cipher = Affine(a=7, b=3)
         assert cipher.decrypt(cipher.encrypt(plaintext).as_bytes()) == plaintext
 
-    def test_invalid_a_raises(self) -> None:
-        with pytest.raises(ValueError, match="coprime"):
-            Affine(a=2, b=0)
+    @pytest.mark.parametrize("a", [0, 2, 13, 26])
+    def test_invalid_a_raises(self, a: int) -> None:
+        with pytest.raises(ValueError, match=rf"coprime with 26, got {a}\."):
+            Affine(a=a, b=0)
 
     def test_possible_keys_count(self) -> None:
         keys = Affine.possible_keys()
@@ -25,3 +26,12 @@ class TestAffine:
 
     def test_a1_b0_is_identity(self) -> None:
         assert Affine(a=1, b=0).encrypt(b"Hello") == b"Hello"
+
+    def test_non_alpha_unchanged(self) -> None:
+        assert Affine(a=5, b=8).encrypt(b"Hi, 42!").as_bytes()[2:] == b", 42!"
+
+    def test_all_keys_roundtrip(self) -> None:
+        plaintext = bytes(range(256))
+        for key in Affine.possible_keys():
+            cipher = Affine(**key)
+            assert cipher.decrypt(cipher.encrypt(plaintext).as_bytes()) == plaintext
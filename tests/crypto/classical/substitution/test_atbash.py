@@ -10,6 +10,11 @@ class TestAtbash:
         a = Atbash()
         assert a.decrypt(a.encrypt(plaintext).as_bytes()) == plaintext
 
+    def test_involution_all_bytes(self) -> None:
+        data = bytes(range(256))
+        a = Atbash()
+        assert a.encrypt(a.encrypt(data).as_bytes()) == data
+
     def test_non_alpha_unchanged(self) -> None:
         result = Atbash().encrypt(b"A1z!")
         assert result.as_str() == "Z1a!"
@@ -35,3 +35,6 @@ class TestCaesar:
 
         result = Caesar(shift=3).encrypt(b"Hello").pipe(C, shift=23)
         assert result.as_str() == "Hello"
+
+    def test_tables_shared_per_shift(self) -> None:
+        assert Caesar(shift=3)._encrypt_table is Caesar(shift=29)._encrypt_table
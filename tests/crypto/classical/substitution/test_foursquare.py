@@ -102,6 +102,10 @@ class TestFourSquare:
         # Non-alpha chars in a key are silently skipped
         assert FourSquare(b"KEY WORD", b"FOO").encrypt(b"ABCD") == FourSquare(b"KEYWORD", b"FOO").encrypt(b"ABCD")
 
+    def test_bytearray_keys(self) -> None:
+        cipher = FourSquare(bytearray(_KEY1), bytearray(_KEY2))
+        assert cipher.encrypt(_PLAINTEXT).as_bytes() == _CIPHERTEXT
+
     def test_different_keys_differ(self) -> None:
         assert FourSquare(b"EXAMPLE", b"KEYWORD").encrypt(_PLAINTEXT) != FourSquare(b"OTHER", b"KEYS").encrypt(
             _PLAINTEXT
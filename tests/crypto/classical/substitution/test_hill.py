@@ -39,16 +39,16 @@ class TestHill:
 
     # ── roundtrip ───────────────────────────────────────────────────────────
 
-    def test_roundtrip_2x2(self) -> None:
+    @pytest.mark.parametrize("pt", [b"HELLOWORLD", b"ABCDEFGH", b"HORDEKIT"])
+    def test_roundtrip_2x2(self, pt: bytes) -> None:
         cipher = Hill(_K2)
-        for pt in (b"HELLOWORLD", b"ABCDEFGH", b"HORDEKIT"):
-            assert cipher.decrypt(cipher.encrypt(pt).as_bytes()) == pt
+        assert cipher.decrypt(cipher.encrypt(pt).as_bytes()) == pt
 
-    def test_roundtrip_3x3(self) -> None:
-        # Inputs must be exact multiples of 3 (otherwise X-padding makes roundtrip lossy)
+    # Inputs must be exact multiples of 3 (otherwise X-padding makes roundtrip lossy)
+    @pytest.mark.parametrize("pt", [b"ACTFOOBAZ", b"ACTPOHGHI", b"CRYPTOSYS"])
+    def test_roundtrip_3x3(self, pt: bytes) -> None:
         cipher = Hill(_K3)
-        for pt in (b"ACTFOOBAZ", b"ACTPOHGHI", b"CRYPTOSYS"):
-            assert cipher.decrypt(cipher.encrypt(pt).as_bytes()) == pt
+        assert cipher.decrypt(cipher.encrypt(pt).as_bytes()) == pt
 
     def test_roundtrip_lowercase(self) -> None:
         cipher = Hill(_K2)
@@ -85,24 +85,19 @@ class TestHill:
 
     # ── invalid parameters ───────────────────────────────────────────────────
 
-    def test_empty_key_raises(self) -> None:
-        with pytest.raises(ValueError, match="non-empty"):
-            Hill([])
-
-    def test_non_square_key_raises(self) -> None:
-        with pytest.raises(ValueError, match="square"):
-            Hill([[1, 2, 3], [4, 5, 6]])
-
-    def test_out_of_range_entry_raises(self) -> None:
-        with pytest.raises(ValueError, match=r"\[0, 25\]"):
-            Hill([[3, 3], [2, 26]])
-
-    def test_singular_key_raises(self) -> None:
-        # [[2,4],[3,6]] has det=2*6-4*3=0, gcd(0,26)=26 → not invertible
-        with pytest.raises(ValueError, match="invertible"):
-            Hill([[2, 4], [3, 6]])
-
-    def test_key_with_gcd_not_1_raises(self) -> None:
-        # [[2,0],[0,2]] has det=4, gcd(4,26)=2 → not invertible mod 26
-        with pytest.raises(ValueError, match="invertible"):
-            Hill([[2, 0], [0, 2]])
+    @pytest.mark.parametrize(
+        ("key", "match"),
+        [
+            ([], "non-empty"),
+            ([[1, 2, 3], [4, 5, 6]], "square"),
+            ([[3, 3], [2, 26]], r"\[0, 25\]"),
+            # det = 2*6 - 4*3 = 0, gcd(0, 26) = 26 → not invertible
+            ([[2, 4], [3, 6]], "invertible"),
+            # det = 4, gcd(4, 26) = 2 → not invertible mod 26
+            ([[2, 0], [0, 2]], "invertible"),
+        ],
+        ids=["empty", "non_square", "out_of_range", "singular", "gcd_not_1"],
+    )
+    def test_invalid_key_raises(self, key: list[list[int]], match: str) -> None:
+        with pytest.raises(ValueError, match=match):
+            Hill(key)
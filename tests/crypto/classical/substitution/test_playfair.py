@@ -96,3 +96,9 @@ class TestPlayfair:
     def test_non_alpha_only_key_raises(self) -> None:
         with pytest.raises(ValueError, match="letter"):
             Playfair(b"123 !")
+
+    def test_square_shared_between_instances(self) -> None:
+        assert Playfair(key=_WIKI_KEY)._square is Playfair(key=_WIKI_KEY)._square
+
+    def test_bytearray_key(self) -> None:
+        assert Playfair(bytearray(_WIKI_KEY)).encrypt(_PLAINTEXT) == Playfair(_WIKI_KEY).encrypt(_PLAINTEXT)
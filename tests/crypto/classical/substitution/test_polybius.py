@@ -71,6 +71,9 @@ class TestPolybius:
         # P -> row 0, col 0 -> "11"
         assert Polybius(b"PLAYFAIR").encrypt(b"P").as_bytes() == b"11"
 
+    def test_bytearray_key(self) -> None:
+        assert Polybius(bytearray(b"KEYWORD")).encrypt(_PLAINTEXT) == Polybius(b"KEYWORD").encrypt(_PLAINTEXT)
+
     def test_empty_key_is_standard_square(self) -> None:
         assert Polybius(b"").encrypt(_PLAINTEXT) == Polybius().encrypt(_PLAINTEXT)
 
@@ -11,5 +11,11 @@ class TestROT13:
         assert r.decrypt(r.encrypt(plaintext).as_bytes()) == plaintext
         assert r.encrypt(r.encrypt(plaintext).as_bytes()) == plaintext
 
+    def test_alphabet_mapping(self) -> None:
+        alphabet = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+        expected = b"NOPQRSTUVWXYZABCDEFGHIJKLMnopqrstuvwxyzabcdefghijklm"
+        assert ROT13().encrypt(alphabet) == expected
+        assert ROT13().decrypt(expected) == alphabet
+
     def test_possible_keys(self) -> None:
         assert ROT13.possible_keys() == [{}]
@@ -13,3 +13,14 @@ class TestROT47:
     def test_non_printable_unchanged(self) -> None:
         result = ROT47().encrypt(b"\x00\x1f\x7f")
         assert result.as_bytes() == b"\x00\x1f\x7f"
+
+    def test_full_printable_range(self) -> None:
+        printable = bytes(range(33, 127))
+        encrypted = ROT47().encrypt(printable).as_bytes()
+        assert encrypted == printable[47:] + printable[:47]
+        assert ROT47().decrypt(encrypted) == printable
+
+    def test_character_mapping(self) -> None:
+        # Range edges (!, ~) plus the letter and digit boundaries
+        assert ROT47().encrypt(b"!AZaz09~") == b"Pp+2K_hO"
+        assert ROT47().decrypt(b"Pp+2K_hO") == b"!AZaz09~"